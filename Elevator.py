@@ -1,10 +1,25 @@
-import heapq
-from typing import Optional
+from typing import Dict, List, Optional
 
 
+# valid request directions: -1 down, 0 internal, 1 up
+_DIRECTIONS = frozenset((-1, 0, 1))
+
 
 class Elevator:
-    def __init__(self, elevatorId, maxFloor = 10):
+    # fixed attribute set, no per-instance __dict__ and typos raise AttributeError
+    __slots__ = ("id", "maxFloor", "currentFloor", "direction", "_upMask", "_downMask", "_activeTarget", "_statusCache", "version")
+
+    id: str
+    maxFloor: int
+    currentFloor: int
+    direction: int
+    _upMask: int
+    _downMask: int
+    _activeTarget: Optional[int]
+    _statusCache: Optional[Dict[str, object]]
+    version: int
+
+    def __init__(self, elevatorId: str, maxFloor: int = 10) -> None:
         self.id = elevatorId
         self.maxFloor = maxFloor
 
@@ -12,48 +27,60 @@ class Elevator:
         # -1 down   0 idle   1 up
         self.direction = 0
 
-        # maintain priority queues for up and down requests
-        self._upHeap = []
-        self._downHeap = []
-        # maintain sets to avoid duplicate floors
-        self._upSet = set()
-        self._downSet = set()
+        # maintain bitmasks of requested floors for up and down requests (bit n set = floor n queued)
+        self._upMask = 0
+        self._downMask = 0
         # active target floor
         self._activeTarget = None
+        # last status snapshot, cleared whenever the state changes
+        self._statusCache = None
+        # bumped whenever the state changes
+        self.version = 0
     
 
     # ------------------------------------------------------------
     # PUBLIC METHODS
     # ------------------------------------------------------------
-    def status(self):
-        """return snapshot of the elevator state"""
-        return {
-            "id": self.id,
-            "currentFloor": self.currentFloor,
-            "direction": self.direction,
-            "queueUp": sorted(self._upSet),    
-            "queueDown": sorted(self._downSet, reverse=True), # sorted in reverse since highest is most prioritary
-            "activeTarget": self._activeTarget,
-        }
-
-    def reset(self):
+    def status(self) -> Dict[str, object]:
+        """return snapshot of the elevator state (shared until the state changes, treat as read-only)"""
+        if self._statusCache is None:
+            self._statusCache = {
+                "id": self.id,
+                "currentFloor": self.currentFloor,
+                "direction": self.direction,
+                "queueUp": self._maskFloors(self._upMask),    
+                "queueDown": self._maskFloors(self._downMask)[::-1], # reversed since highest is most prioritary
+                "activeTarget": self._activeTarget,
+            }
+        return self._statusCache
+
+    def reset(self) -> Dict[str, object]:
         """reset the elevator to a default state"""
         self.currentFloor = 0
         self.direction = 0
-        self._upSet = set()
-        self._downSet = set()
-        self._upHeap = []
-        self._downHeap = []
+        self._upMask = 0
+        self._downMask = 0
         self._activeTarget = None
+        self._statusCache = None
+        self.version += 1
         return self.status()
 
-    def step(self, steps = 1):
+    def step(self, steps: int = 1) -> Dict[str, object]:
         """move elevator by the number of steps given"""
         if steps < 1:
             raise ValueError("steps must be at least 1")
 
-        for _ in range(steps):
-            self._advanceOnce()
+        # nothing to move toward, only an idle direction can change
+        if self._activeTarget is None:
+            if self.direction:
+                self.direction = 0
+                self._statusCache = None
+                self.version += 1
+            return self.status()
+
+        self._statusCache = None
+        self.version += 1
+        self._advance(steps)
 
         # if no more targets and more steps set direction to idle
         if self._activeTarget is None and steps > 1:
@@ -61,7 +88,7 @@ class Elevator:
 
         return self.status()
 
-    def requestFloor(self, floor, direction):
+    def requestFloor(self, floor: int, direction: int) -> None:
         """register a stop request for the elevator
 
         
@@ -69,8 +96,10 @@ class Elevator:
         int direction: direction of request (1 for up, -1 for down, 0 for internal request from passenger inside)
         """
         # validate floor and direction
-        self._validateFloor(floor)
-        self._validateDirection(direction)
+        if not 0 <= floor <= self.maxFloor:
+            raise ValueError("floor cannot be negative" if floor < 0 else "floor cannot exceed max floor")
+        if direction not in _DIRECTIONS:
+            raise ValueError("direction must be -1, 0, or 1")
 
         # passenger inside requesting floor
         if direction == 0:
@@ -100,6 +129,8 @@ class Elevator:
                 return
             self._addDown(floor)
         
+        self._statusCache = None
+        self.version += 1
         if not self._activeTarget:
             self._activeTarget = floor
         # check if we need to update the active target
@@ -111,40 +142,49 @@ class Elevator:
     # ------------------------------------------------------------
     # PRIVATE METHODS
     # ------------------------------------------------------------
-    def _advanceOnce(self):
-        """handles logic for moving elevator one step"""
-        # check for new active target
-        if self._activeTarget is None:
-            self.direction = 0
-            return
-            
+    def _advance(self, steps: int) -> None:
+        """handles logic for moving elevator the given number of steps"""
+        remaining = steps
+        while remaining > 0:
+            # check for new active target
+            if self._activeTarget is None:
+                self.direction = 0
+                return
 
-        # move elevator in the direction of the active target
-
-        # elevator below the target floor
-        if self.currentFloor < self._activeTarget:
-            self.direction = 1
-            # remove floor from up queue
-            self._removeFloor(self.currentFloor)
-            self.currentFloor += 1
-
-        # elevator above the target floor
-        elif self.currentFloor > self._activeTarget:
-            self.direction = -1
-            # remove floor from down queue
-            self._removeFloor(self.currentFloor)
-            self.currentFloor -= 1
-        
+            # move elevator in the direction of the active target, jumping
+            # straight there (or as far as the remaining steps allow)
+            distance = self._activeTarget - self.currentFloor
+            if distance:
+                self.direction = (distance > 0) - (distance < 0)
+                move = min(abs(distance), remaining)
+                departed = self.currentFloor
+                self.currentFloor += move * self.direction
+                remaining -= move
+
+                # ran out of steps before reaching the target
+                if self.currentFloor != self._activeTarget:
+                    # remove every floor the elevator departed from along the way
+                    self._removeFloors(departed, self.currentFloor - self.direction)
+                    return
+
+                # arrived at the target floor
+                # remove the departed floors and the target floor from queue in one pass
+                self._removeFloors(departed, self.currentFloor)
+            else:
+                # already at the target floor, arriving takes a single step
+                remaining -= 1
+                # remove floor from queue
+                self._removeFloor(self.currentFloor)
 
-        # arrived at the target floor
-        if self.currentFloor == self._activeTarget:
-            # remove floor from queue
-            self._removeFloor(self.currentFloor)
             # get next target
             self._activeTarget = self._nextTarget()
 
+            # idle at the target with nothing else queued, further steps change nothing
+            if not distance and self._activeTarget == self.currentFloor:
+                return
+
     
-    def _nextTarget(self):
+    def _nextTarget(self) -> Optional[int]:
         """returns the next target floor"""
 
         # elevator is currently moving up
@@ -196,115 +236,93 @@ class Elevator:
     # ------------------------------------------------------------
     # QUEUE METHODS
     # ------------------------------------------------------------
-    def _addUp(self, floor):
+    def _addUp(self, floor: int) -> bool:
         """adds a floor to the up queue"""
+        bit = 1 << floor
         # avoid duplicates
-        if floor in self._upSet:
+        if self._upMask & bit:
             return False
 
-        heapq.heappush(self._upHeap, floor)
-        self._upSet.add(floor)
+        self._upMask |= bit
         return True
 
-    def _addDown(self, floor: int):
+    def _addDown(self, floor: int) -> bool:
         """adds a floor to the down queue"""
+        bit = 1 << floor
         # avoid duplicates
-        if floor in self._downSet:
+        if self._downMask & bit:
             return False
 
-        # add the (-1 * floor) to the down queue so the highest floor number is the most prioritary (most negative number)
-        heapq.heappush(self._downHeap, -1 * floor)
-        self._downSet.add(floor)
+        self._downMask |= bit
         return True
 
-    def _peekUp(self, currentFloor):
+    def _peekUp(self, currentFloor: int) -> Optional[int]:
         """returns the next floor in the up queue that is above currentFloor"""
-        # iterate through the heap to find the first valid floor (highest floor > currentFloor)
-        for floor in sorted(self._upHeap):
-            if floor > currentFloor:
-                return floor
-        return None
+        # lowest set bit above currentFloor
+        above = self._upMask >> (currentFloor + 1)
+        if not above:
+            return None
+        return currentFloor + (above & -above).bit_length()
 
-    def _peekDown(self, currentFloor):
+    def _peekDown(self, currentFloor: int) -> Optional[int]:
         """returns the next floor in the down queue that is below currentFloor"""
-        # iterate through the heap to find the first valid floor (highest floor < currentFloor)
-        for negFloor in sorted(self._downHeap):
-            # convert the negative floor to a positive floor
-            floor = -1 * negFloor
-            if floor < currentFloor:
-                return floor
-        return None
+        # highest set bit below currentFloor
+        below = self._downMask & ((1 << currentFloor) - 1)
+        if not below:
+            return None
+        return below.bit_length() - 1
     
-    def _peekAnyUp(self):
+    def _peekAnyUp(self) -> Optional[int]:
         """returns the lowest floor in the up queue (regardless of current position)"""
-        if not self._upHeap:
+        if not self._upMask:
             return None
-        return min(self._upHeap)
+        return (self._upMask & -self._upMask).bit_length() - 1
     
-    def _peekAnyDown(self):
+    def _peekAnyDown(self) -> Optional[int]:
         """returns the highest floor in the down queue (regardless of current position)"""
-        if not self._downHeap:
+        if not self._downMask:
             return None
-        # heap stores negative values, so min negative = highest floor
-        return -1 * min(self._downHeap)
+        return self._downMask.bit_length() - 1
     
-    def _peekDownAbove(self, currentFloor):
+    def _peekDownAbove(self, currentFloor: int) -> Optional[int]:
         """returns the highest floor in the down queue that is above currentFloor"""
         # When going up to service down requests, we want the highest floor first
-        validFloors = []
-        for negFloor in self._downHeap:
-            floor = -1 * negFloor
-            if floor > currentFloor:
-                validFloors.append(floor)
-
-        if not validFloors:
-            return None
-
-        return max(validFloors)
+        if self._downMask >> (currentFloor + 1):
+            return self._downMask.bit_length() - 1
+        return None
     
-    def _peekUpBelow(self, currentFloor):
+    def _peekUpBelow(self, currentFloor: int) -> Optional[int]:
         """returns the lowest floor in the up queue that is below currentFloor"""
         # When going down to service up requests, we want the lowest floor first
-        validFloors = []
-        for floor in self._upHeap:
-            if floor < currentFloor:
-                validFloors.append(floor)
-
-        if not validFloors:
+        below = self._upMask & ((1 << currentFloor) - 1)
+        if not below:
             return None
-
-        return min(validFloors)
+        return (below & -below).bit_length() - 1
     
-    def _removeFloor(self, floor):
+    def _removeFloor(self, floor: int) -> None:
         """remove a floor from the queue based on current direction"""
+        self._removeFloors(floor, floor)
+
+    def _removeFloors(self, first: int, last: int) -> None:
+        """remove a range of floors from the queue based on current direction"""
+        low, high = min(first, last), max(first, last)
+        # bits for every floor in [low, high]
+        span = ((1 << (high - low + 1)) - 1) << low
         # only remove from the queue that matches our current direction
         if self.direction > 0:
             # going up, remove from up queue
-            if floor in self._upSet:
-                self._upSet.remove(floor)
-                # rebuild the heap without this floor
-                self._upHeap = [f for f in self._upHeap if f != floor]
-                heapq.heapify(self._upHeap)
-        
+            self._upMask &= ~span
+
         elif self.direction < 0:
             # going down, remove from down queue
-            if floor in self._downSet:
-                self._downSet.remove(floor)
-                # rebuild the heap without this floor
-                self._downHeap = [f for f in self._downHeap if f != -floor]
-                heapq.heapify(self._downHeap)
-
-    # ------------------------------------------------------------
-    # VALIDATION METHODS
-    # ------------------------------------------------------------
-    def _validateFloor(self, floor: int):
-        """validates the floor number"""
-        if floor < 0:
-            raise ValueError("floor cannot be negative")
-        if floor > self.maxFloor:
-            raise ValueError("floor cannot exceed max floor")
-    
-    def _validateDirection(self, direction: int):
-        """validates the direction number"""
-        if direction not in (-1, 0, 1):
-            raise ValueError("direction must be -1, 0, or 1")
\ No newline at end of file
+            self._downMask &= ~span
+
+    @staticmethod
+    def _maskFloors(mask: int) -> List[int]:
+        """returns the floors set in a queue bitmask in ascending order"""
+        floors: List[int] = []
+        while mask:
+            lowest = mask & -mask
+            floors.append(lowest.bit_length() - 1)
+            mask ^= lowest
+        return floors
@@ -5,6 +5,21 @@ from typing import Optional
 
 # API Configuration
 API_BASE_URL = "http://localhost:8000"
+# shared session keeps the connection to the API alive between commands
+SESSION = requests.Session()
+
+# Display Configuration
+DIRECTION_MAP = {-1: "DOWN ↓", 0: "IDLE ⏸", 1: "UP ↑"}
+MENU_TEXT = "\n".join([
+    "\nAvailable Commands:",
+    "  1. View elevator status",
+    "  2. Request floor (with direction)",
+    "  3. Step elevator",
+    "  4. Reset elevator",
+    "  5. Help",
+    "  q. Quit",
+    "-" * 60,
+])
 
 
 def print_banner():
@@ -16,20 +31,13 @@ def print_banner():
 
 def print_menu():
     """Print the main menu"""
-    print("\nAvailable Commands:")
-    print("  1. View elevator status")
-    print("  2. Request floor (with direction)")
-    print("  3. Step elevator")
-    print("  4. Reset elevator")
-    print("  5. Help")
-    print("  q. Quit")
-    print("-" * 60)
+    print(MENU_TEXT)
 
 
 def get_status() -> Optional[dict]:
     """Get current elevator status"""
     try:
-        response = requests.get(f"{API_BASE_URL}/api/elevator")
+        response = SESSION.get(f"{API_BASE_URL}/api/elevator")
         response.raise_for_status()
         return response.json()
     except requests.exceptions.ConnectionError:
@@ -51,8 +59,7 @@ def display_status(status: dict):
     print(f"  ID:              {status['id']}")
     print(f"  Current Floor:   {status['currentFloor']}")
     
-    direction_map = {-1: "DOWN ↓", 0: "IDLE ⏸", 1: "UP ↑"}
-    direction_str = direction_map.get(status['direction'], str(status['direction']))
+    direction_str = DIRECTION_MAP.get(status['direction'], str(status['direction']))
     print(f"  Direction:       {direction_str}")
     
     print(f"  Active Target:   {status['activeTarget'] if status['activeTarget'] is not None else 'None'}")
@@ -78,7 +85,7 @@ def request_floor():
             print("❌ Error: Direction must be -1, 0, or 1")
             return
         
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE_URL}/api/elevator/request",
             json={"floor": floor, "direction": direction}
         )
@@ -108,7 +115,7 @@ def step_elevator():
         steps = input("Enter number of steps (default=1): ").strip()
         steps = int(steps) if steps else 1
         
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE_URL}/api/elevator/step",
             json={"steps": steps}
         )
@@ -140,7 +147,7 @@ def reset_elevator():
         return
     
     try:
-        response = requests.post(f"{API_BASE_URL}/api/elevator/reset")
+        response = SESSION.post(f"{API_BASE_URL}/api/elevator/reset")
         response.raise_for_status()
         
         print("✅ Elevator reset successfully!")
@@ -183,10 +190,27 @@ def print_help():
     print("\n" + "="*60 + "\n")
 
 
+def view_status():
+    """Fetch and display the current elevator status"""
+    status = get_status()
+    if status:
+        display_status(status)
+
+
+# menu choice -> handler
+COMMANDS = {
+    '1': view_status,
+    '2': request_floor,
+    '3': step_elevator,
+    '4': reset_elevator,
+    '5': print_help,
+}
+
+
 def check_api_connection():
     """Check if API is accessible"""
     try:
-        response = requests.get(f"{API_BASE_URL}/")
+        response = SESSION.get(f"{API_BASE_URL}/")
         return response.status_code == 200
     except:
         return False
@@ -206,32 +230,17 @@ def main():
     print(f"✅ Connected to API at {API_BASE_URL}\n")
     
     # Show initial status
-    status = get_status()
-    if status:
-        display_status(status)
+    view_status()
     
     # Main loop
     while True:
         try:
             print_menu()
             choice = input("Enter command: ").strip().lower()
+            handler = COMMANDS.get(choice)
             
-            if choice == '1':
-                status = get_status()
-                if status:
-                    display_status(status)
-            
-            elif choice == '2':
-                request_floor()
-            
-            elif choice == '3':
-                step_elevator()
-            
-            elif choice == '4':
-                reset_elevator()
-            
-            elif choice == '5':
-                print_help()
+            if handler:
+                handler()
             
             elif choice == 'q' or choice == 'quit':
                 print("\n👋 Goodbye!\n")
@@ -1,64 +1,121 @@
-import uvicorn
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import asyncio
+import os
+import secrets
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 from Elevator import Elevator
 
 
 # request pydantic models
 class FloorRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     floor: int
     direction: int  # -1 for down, 0 for internal, 1 for up
 
 class StepRequest(BaseModel):
-    steps: int = 1 # default to 1 step
+    model_config = ConfigDict(extra="forbid")
 
-class ResetRequest(BaseModel):
-    pass  # No parameters needed for reset
+    steps: int = 1 # default to 1 step
 
 
-app = FastAPI(title="The Elevator API")
+# serialize responses with orjson instead of the stdlib json encoder
+app = FastAPI(title="The Elevator API", default_response_class=ORJSONResponse)
+# compress only responses large enough to benefit, at the cheapest level
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=1)
 elevator = Elevator("Elevator-1", maxFloor=10)
 
+# GET / payload never changes, serialize it once
+_READY_BODY = orjson.dumps({"service": "elevator", "status": "ready"})
+
+# per-process prefix so ETags from before a restart never match the new state
+_ETAG_PREFIX = secrets.token_hex(4)
+# (state version, serialized status body) for the last state served
+_stateCache = (None, b"")
+# how often the status stream checks for a state change
+_STREAM_INTERVAL = 0.05
+
+# 400 response for a rejected elevator operation, returned directly instead of raising HTTPException
+def _badRequest(detail):
+    return ORJSONResponse({"detail": detail}, status_code=400)
+
+# serialized elevator status, re-encoded only when the state version changes
+def _stateBody():
+    global _stateCache
+    if _stateCache[0] != elevator.version:
+        _stateCache = (elevator.version, orjson.dumps(elevator.status()))
+    return _stateCache[1]
+
 # endpoint for checking if server is running
 @app.get("/")
-def getStatus():
-    return {"service": "elevator", "status": "ready"}
+async def getStatus():
+    return Response(_READY_BODY, media_type="application/json")
 
 # endpoint for getting status of elevator
 @app.get("/api/elevator")
-def getState():
-    return elevator.status()
+async def getState(request: Request):
+    etag = f'W/"{_ETAG_PREFIX}-{elevator.version}"'
+
+    # client already has the current state
+    ifNoneMatch = request.headers.get("if-none-match")
+    if ifNoneMatch and etag in (tag.strip() for tag in ifNoneMatch.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(_stateBody(), media_type="application/json", headers={"ETag": etag})
+
+# endpoint for streaming elevator status as server-sent events, one event per state change
+@app.get("/api/elevator/stream")
+async def streamState(request: Request):
+    async def events():
+        lastVersion = None
+        while not await request.is_disconnected():
+            if elevator.version != lastVersion:
+                lastVersion = elevator.version
+                yield b"data: " + _stateBody() + b"\n\n"
+            await asyncio.sleep(_STREAM_INTERVAL)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
 
 # endpoint for adding request to elevator
 @app.post("/api/elevator/request")
-def requestFloor(request: FloorRequest):
+async def requestFloor(request: FloorRequest):
     try:
         elevator.requestFloor(request.floor, request.direction)
     except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return _badRequest(str(exc))
 
-    return getState()
+    return elevator.status()
 
 # endpoint for calling elevator steps
 @app.post("/api/elevator/step")
-def stepElevator(request: StepRequest):
+async def stepElevator(request: StepRequest):
     try:
         elevator.step(request.steps)
     except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return _badRequest(str(exc))
 
-    return getState()
+    return elevator.status()
 
 # endpoint for resetting eleavtor
 @app.post("/api/elevator/reset")
-def resetElevator():
+async def resetElevator():
     """Reset elevator to default"""
     try:
         return elevator.reset()
     except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return _badRequest(str(exc))
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # only needed to run the dev server, not when main is imported as an ASGI app
+    import uvicorn
+
+    # httptools parses HTTP, loop="auto" picks uvloop wherever it is installed (not on Windows)
+    # limit_concurrency answers 503 once saturated instead of queueing without bound
+    # timeout_graceful_shutdown stops open status streams from holding up shutdown
+    # auto-reload watches files in a separate process, so only enable it for development (DEV=1)
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, loop="auto", http="httptools", limit_concurrency=256, timeout_graceful_shutdown=5, reload=os.getenv("DEV") == "1")
 